@@ -38,30 +38,10 @@ The `hrosailing` package is published under the [Apache 2.0 License](https://\
 """
 
 # pylint: disable=wrong-import-order
-# pylint: disable=wrong-import-position
 # pylint: disable=unused-import
 
 from ._version import __version__ as version
 
-# Tell users if and which hard dependencies are missing
-hard_dependencies = ("numpy", "matplotlib", "scipy")
-# soft_dependencies = ("pandas", "pynmea2")
-missing_dependencies = []
-
-for dependency in hard_dependencies:
-    try:
-        __import__(dependency)
-    except ImportError as ie:
-        missing_dependencies.append(f"{dependency}: {ie}")
-
-if missing_dependencies:
-    raise ImportError(
-        "Unable to import required dependencies:\n"
-        + "\n".join(missing_dependencies)
-    )
-del hard_dependencies, dependency, missing_dependencies
-
-
 import hrosailing.core
 import hrosailing.cruising
 import hrosailing.models
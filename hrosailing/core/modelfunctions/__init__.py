@@ -29,9 +29,7 @@ def ws_times_wa(ws, wa, scal):
     scal: int or float
         The scaling factor.
     """
-    ws = np.asarray(ws)
-    wa = np.asarray(wa)
-    return scal * ws * wa
+    return _ws_times_wa(np.asarray(ws), np.asarray(wa), scal)
 
 
 def ws_concave_dt_wa(ws, wa, *params):
@@ -45,15 +43,23 @@ def ws_concave_dt_wa(ws, wa, *params):
     + a_7(360 - y) + a_9((360 - y) - a_8)^2 + a_{10}x(360 - y)
 
     """
+    ws = np.asarray(ws)
     wa = np.asarray(wa)
+    mirrored_wa = 360 - wa
 
-    return (
-        concave_function(ws, params[0], params[1], params[2])
-        + inverted_shifted_parabola(wa, params[3], params[4], params[5])
-        + ws_times_wa(ws, wa, params[6])
-        + inverted_shifted_parabola(360 - wa, params[7], params[8], params[9])
-        + ws_times_wa(ws, 360 - wa, params[10])
+    val = concave_function(ws, params[0], params[1], params[2])
+    val = _add_in_place(
+        val, inverted_shifted_parabola(wa, params[3], params[4], params[5])
+    )
+    val = _add_in_place(val, _ws_times_wa(ws, wa, params[6]))
+    val = _add_in_place(
+        val,
+        inverted_shifted_parabola(
+            mirrored_wa, params[7], params[8], params[9]
+        ),
     )
+    val = _add_in_place(val, _ws_times_wa(ws, mirrored_wa, params[10]))
+    return val
 
 
 def ws_wa_s_dt(ws, wa, *params):
@@ -69,15 +75,21 @@ def ws_wa_s_dt(ws, wa, *params):
     + a_{13}x(360 - y)
 
     """
+    ws = np.asarray(ws)
     wa = np.asarray(wa)
+    mirrored_wa = 360 - wa
 
-    return (
-        s_shaped(ws, params[0], params[1], params[2], params[3])
-        + s_shaped(wa, params[4], params[5], params[6], params[7])
-        + ws_times_wa(ws, wa, params[8])
-        + s_shaped(360 - wa, params[9], params[10], params[11], params[12])
-        + ws_times_wa(ws, 360 - wa, params[13])
+    val = s_shaped(ws, params[0], params[1], params[2], params[3])
+    val = _add_in_place(
+        val, s_shaped(wa, params[4], params[5], params[6], params[7])
+    )
+    val = _add_in_place(val, _ws_times_wa(ws, wa, params[8]))
+    val = _add_in_place(
+        val,
+        s_shaped(mirrored_wa, params[9], params[10], params[11], params[12]),
     )
+    val = _add_in_place(val, _ws_times_wa(ws, mirrored_wa, params[13]))
+    return val
 
 
 def ws_s_dt_wa_gauss(ws, wa, *params):
@@ -93,13 +105,18 @@ def ws_s_dt_wa_gauss(ws, wa, *params):
     + a_7\\exp\\left(\\frac{-((360 - y) - a_8)^2}{2a_9}\\right)
 
     """
+    ws = np.asarray(ws)
     wa = np.asarray(wa)
+    mirrored_wa = 360 - wa
 
-    return (
-        s_shaped(ws, params[0], params[1], params[2], params[3])
-        + gaussian_model(wa, params[4], params[5], params[6])
-        + gaussian_model(360 - wa, params[7], params[8], params[9])
+    val = s_shaped(ws, params[0], params[1], params[2], params[3])
+    val = _add_in_place(
+        val, gaussian_model(wa, params[4], params[5], params[6])
+    )
+    val = _add_in_place(
+        val, gaussian_model(mirrored_wa, params[7], params[8], params[9])
     )
+    return val
 
 
 def ws_s_s_dt_wa_gauss_comb(ws, wa, *params):
@@ -115,15 +132,20 @@ def ws_s_s_dt_wa_gauss_comb(ws, wa, *params):
     + a_11x(360 - y)
 
     """
+    ws = np.asarray(ws)
     wa = np.asarray(wa)
+    mirrored_wa = 360 - wa
 
-    return (
-        s_shaped(ws, params[0], params[1], params[2], params[3])
-        + gaussian_model(wa, params[4], params[5], params[6])
-        + ws_times_wa(ws, wa, params[7])
-        + gaussian_model(360 - wa, params[8], params[9], params[10])
-        + ws_times_wa(ws, 360 - wa, params[11])
+    val = s_shaped(ws, params[0], params[1], params[2], params[3])
+    val = _add_in_place(
+        val, gaussian_model(wa, params[4], params[5], params[6])
+    )
+    val = _add_in_place(val, _ws_times_wa(ws, wa, params[7]))
+    val = _add_in_place(
+        val, gaussian_model(mirrored_wa, params[8], params[9], params[10])
     )
+    val = _add_in_place(val, _ws_times_wa(ws, mirrored_wa, params[11]))
+    return val
 
 
 def ws_s_wa_gauss(ws, wa, *params):
@@ -139,13 +161,14 @@ def ws_s_wa_gauss(ws, wa, *params):
     + a_6\\exp\\left(\\frac{-((360 - y) - a_7)^2}{2a_8}\\right)
 
     """
+    ws = np.asarray(ws)
     wa = np.asarray(wa)
+    mirrored_wa = 360 - wa
 
-    return (
-        s_shaped(ws, *params[0:4])
-        + gaussian_model(wa, *params[4:8])
-        + gaussian_model(360 - wa, *params[8:12])
-    )
+    val = s_shaped(ws, *params[0:4])
+    val = _add_in_place(val, gaussian_model(wa, *params[4:8]))
+    val = _add_in_place(val, gaussian_model(mirrored_wa, *params[8:12]))
+    return val
 
 
 def ws_s_wa_gauss_and_square(ws, wa, *params):
@@ -163,15 +186,31 @@ def ws_s_wa_gauss_and_square(ws, wa, *params):
     """
     ws = np.asarray(ws)
     wa = np.asarray(wa)
-    return (
-        (
-            s_shaped(ws, params[0], params[1], params[2], params[3])
-            + ws
-            * (
-                gaussian_model(wa, params[4], params[5], params[6])
-                + gaussian_model(360 - wa, params[7], params[8], params[9])
-            )
-        )
-        * wa
-        * (360 - wa)
+    mirrored_wa = 360 - wa
+    val = gaussian_model(wa, params[4], params[5], params[6])
+    val = _add_in_place(
+        val, gaussian_model(mirrored_wa, params[7], params[8], params[9])
     )
+    val = ws * val
+    val += s_shaped(ws, params[0], params[1], params[2], params[3])
+    val *= wa
+    val *= mirrored_wa
+    return val
+
+
+def _ws_times_wa(ws, wa, scal):
+    # `ws_times_wa` for inputs which are already converted to arrays
+    return scal * ws * wa
+
+
+def _add_in_place(total, term):
+    # adds `term` to `total`, reusing the buffer of `total` if the sum fits
+    # into it, such that only one term has to be kept in memory at a time
+    if (
+        isinstance(total, np.ndarray)
+        and total.shape == np.broadcast_shapes(total.shape, np.shape(term))
+        and np.can_cast(np.result_type(total, term), total.dtype)
+    ):
+        total += term
+        return total
+    return total + term
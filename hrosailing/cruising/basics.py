@@ -102,11 +102,12 @@ def convex_direction(
     bsp = np.array(bsp).ravel()
     wa = np.deg2rad(np.array(wa).ravel())
 
-    polar_pts = np.column_stack(
-        (bsp * np.cos(wa).ravel(), bsp * np.sin(wa).ravel())
-    )
+    polar_pts = np.empty((len(wa), 2))
+    np.cos(wa, out=polar_pts[:, 0])
+    np.sin(wa, out=polar_pts[:, 1])
+    polar_pts *= bsp[:, None]
     conv = ConvexHull(polar_pts)
-    vert = sorted(conv.vertices)
+    vert = np.sort(conv.vertices)
 
     wa = np.rad2deg(wa)
 
@@ -20,6 +20,7 @@ Examples
 """
 
 import itertools
+from functools import lru_cache
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -41,6 +42,8 @@ from scipy.spatial.qhull import QhullError
 
 from hrosailing.polardiagram import PolarDiagram
 
+_RASTERIZATION_THRESHOLD = 5000
+
 
 class HROPolar(PolarAxes):
     """
@@ -280,6 +283,11 @@ class HROColorGradient(Axes):
             Keyword arguments to change position and appearance of the colorbar
             or legend respectively.
             As in `HROPolar.plot`.
+
+        Notes
+        -----
+        Plots of more than 5000 points are rasterized, unless the keyword
+        `rasterized` is given explicitly.
         """
         if not isinstance(args[0], PolarDiagram):
             super().scatter(*args, **kwargs)
@@ -296,6 +304,7 @@ class HROColorGradient(Axes):
             _configure_legend(self, bsp, colors, "Boat Speed", **legend_kw)
 
         color_gradient = _determine_color_gradient(colors, bsp.ravel())
+        _rasterize_if_dense(kwargs, len(points))
 
         self.scatter(ws, wa, c=color_gradient, **kwargs)
 
@@ -366,27 +375,10 @@ class Axes3D(pltAxes3D):
 
         triang = Triangulation(x, y)
 
-        txs = x[triang.triangles]
-        tys = y[triang.triangles]
-        tzs = z[triang.triangles]
-
-        diffz = [
-            (tzs[:, idx1] - tzs[:, idx2]) ** 2
-            for idx1, idx2 in itertools.combinations([0, 1, 2], 2)
-        ]
-
-        not_too_narrow = np.logical_or(
-            diffz[0] > 0.2, diffz[1] > 0.2, diffz[2] > 0.2
-        )
-        axis_skip = np.logical_or(
-            np.sign(txs[:, 0]) != np.sign(txs[:, 1]),
-            np.sign(txs[:, 0]) != np.sign(txs[:, 2]),
-        )
-        northern = np.logical_and(*[tys[:, i] > 0 for i in range(2)])
-        no_northern_skip = np.logical_not(np.logical_and(axis_skip, northern))
-        mask = np.logical_and(not_too_narrow, no_northern_skip)
+        mask = _get_surface_triangle_mask(x, y, z, triang.triangles)
 
         color_map = _create_color_map(colors)
+        _rasterize_if_dense(kwargs, len(x))
 
         _set_3d_axis_labels(self)
         _remove_3d_tick_labels_for_polar_coordinates(self)
@@ -402,7 +394,10 @@ class Axes3D(pltAxes3D):
         # wa = (-wa)%360 - 90
         wa_rad = np.deg2rad(wa)
 
-        x, y = bsp * np.sin(wa_rad), bsp * np.cos(wa_rad)
+        x = np.sin(wa_rad)
+        x *= bsp
+        y = np.cos(wa_rad, out=wa_rad)
+        y *= bsp
         return x, y, ws
 
     def _plot3d(self, x, y, z, colors, **plot_kw):
@@ -410,6 +405,7 @@ class Axes3D(pltAxes3D):
         _remove_3d_tick_labels_for_polar_coordinates(self)
 
         color_map = _create_color_map(colors)
+        _rasterize_if_dense(plot_kw, len(x))
 
         super().scatter(x, y, z, c=z, cmap=color_map, **plot_kw)
 
@@ -440,6 +436,7 @@ def _plot(
         ax.plot([], [], **kwargs)
         return
 
+    lines = []
     for slice_, info_ in safe_zip(slices, info):
         slice_ = slice_[:, np.argsort(slice_[1])]
         if use_convex_hull:
@@ -453,7 +450,12 @@ def _plot(
         if use_scatter:
             ax.scatter(wa, bsp, **kwargs)
         else:
-            ax.plot(wa, bsp, **kwargs)
+            lines.extend((wa, bsp))
+
+    # a single call creates one line per slice, but adds them to the axes
+    # and rescales the view only once
+    if lines:
+        ax.plot(*lines, **kwargs)
 
 
 def _get_info_intervals(info_):
@@ -468,10 +470,16 @@ def _get_info_intervals(info_):
 def _merge(wa, intervals):
     if len(intervals) == 0:
         return np.empty((0))
-    wa_in_intervals = [
-        np.concatenate([wa[interval], [np.NAN]]) for interval in intervals
-    ]
-    return np.concatenate(wa_in_intervals)[:-1]
+    # the entries of the intervals one after another, consecutive intervals
+    # are separated by a single nan
+    lengths = [len(interval) for interval in intervals]
+    indices = np.concatenate(intervals).astype(int)
+    positions = np.arange(len(indices)) + np.repeat(
+        np.arange(len(intervals)), lengths
+    )
+    merged = np.full(len(indices) + len(intervals) - 1, np.nan)
+    merged[positions] = wa[indices]
+    return merged
 
 
 def _alter_with_info(wa, bsp, info_):
@@ -484,19 +492,18 @@ def _alter_with_info(wa, bsp, info_):
 def _get_convex_hull(slice_, info_):
     ws, wa, bsp = slice_
     wa_rad = np.deg2rad(wa)
-    points = np.column_stack([bsp * np.cos(wa_rad), bsp * np.sin(wa_rad)])
-    try:
-        vertices = ConvexHull(points).vertices
-    except (ValueError, QhullError):
+    points = np.empty((len(wa_rad), 2))
+    np.cos(wa_rad, out=points[:, 0])
+    np.sin(wa_rad, out=points[:, 1])
+    points *= np.asarray(bsp)[:, None]
+    vertices = _get_convex_hull_vertices(points.tobytes())
+    if vertices is None:
         return ws, wa, bsp, info_
-    slice_ = slice_.T[vertices]
+    # hull vertices ordered by wind angle
+    vertices = vertices[np.argsort(wa[vertices], kind="stable")]
+    slice_ = slice_[:, vertices]
     if info_ is not None:
         info_ = [info_[vert] for vert in vertices]
-        slice_, info_ = zip(*sorted(zip(slice_, info_), key=lambda x: x[0][1]))
-        info_ = list(info_)
-    else:
-        slice_ = sorted(slice_, key=lambda x: x[1])
-    slice_ = np.array(slice_).T
 
     if slice_[1, 0] == 0 and slice_[1, -1] == 360:
         ws, wa, bsp = slice_
@@ -507,14 +514,14 @@ def _get_convex_hull(slice_, info_):
         return ws, wa, bsp, info_
 
     if slice_[1, 0] == 0:
-        slice_ = np.column_stack([slice_, [slice_[0, 0], 360, slice_[2, 0]]])
+        slice_ = _pad_slice(slice_, last=[slice_[0, 0], 360, slice_[2, 0]])
         if info_ is not None:
             info_ = info_ + [info_[0]]
         ws, wa, bsp = slice_
         return ws, wa, bsp, info_
 
     if slice_[1, -1] == 360:
-        slice_ = np.column_stack([[slice_[0, -1], 0, slice_[2, -1]], slice_])
+        slice_ = _pad_slice(slice_, first=[slice_[0, -1], 0, slice_[2, -1]])
         if info_ is not None:
             info_ = [info_[-1]] + info_
         ws, wa, bsp = slice_
@@ -523,16 +530,19 @@ def _get_convex_hull(slice_, info_):
     # if wind angle difference is big, wrap around
     # estimate bsp value at 0 (360 resp)
 
-    x0 = slice_[2, 0] * np.sin(np.deg2rad(slice_[1, 0]))
-    x1 = slice_[2, -1] * np.sin(np.deg2rad(slice_[1, -1]))
-    y0 = slice_[2, 0] * np.cos(np.deg2rad(slice_[1, 0]))
-    y1 = slice_[2, -1] * np.cos(np.deg2rad(slice_[1, -1]))
+    # first and last hull vertex in cartesian coordinates
+    _, end_wa, end_bsp = slice_[:, [0, -1]]
+    end_wa = np.deg2rad(end_wa)
+    x0, x1 = end_bsp * np.sin(end_wa)
+    y0, y1 = end_bsp * np.cos(end_wa)
     lamb = x0 / (x0 - x1)
     approx_ws = lamb * slice_[0, 0] + (1 - lamb) * slice_[0, -1]
     approx_bsp = lamb * y0 + (1 - lamb) * y1
 
-    slice_ = np.column_stack(
-        [[approx_ws, 0, approx_bsp], slice_, [approx_ws, 360, approx_bsp]]
+    slice_ = _pad_slice(
+        slice_,
+        first=[approx_ws, 0, approx_bsp],
+        last=[approx_ws, 360, approx_bsp],
     )
     if info_ is not None:
         info_ = [None] + info_ + [None]
@@ -542,6 +552,20 @@ def _get_convex_hull(slice_, info_):
     return ws, wa, bsp, info_
 
 
+def _pad_slice(slice_, first=None, last=None):
+    # copies `slice_` into a single new buffer with an additional column
+    # `first` in front and/or an additional column `last` at the end
+    start = int(first is not None)
+    n_cols = slice_.shape[1]
+    padded = np.empty((3, start + n_cols + int(last is not None)))
+    padded[:, start : start + n_cols] = slice_
+    if first is not None:
+        padded[:, 0] = first
+    if last is not None:
+        padded[:, -1] = last
+    return padded
+
+
 def plot_polar(*args, **kwargs):
     """
     Creates a single `HROPolar` Axes and calls its `plot` method.
@@ -634,12 +658,15 @@ def scatter_3d(*args, **kwargs):
 
 
 def _configure_axes(ax, labels, colors, show_legend, legend_kw, **kwargs):
-    _configure_colors(ax, labels, colors)
+    color_mode = _classify_colors(labels, colors)
+    _configure_colors(ax, labels, colors, color_mode)
     _check_plot_kw(kwargs, True)
     if show_legend:
         if legend_kw is None:
             legend_kw = {}
-        _configure_legend(ax, labels, colors, "True Wind Speed", **legend_kw)
+        _configure_legend(
+            ax, labels, colors, "True Wind Speed", color_mode, **legend_kw
+        )
 
 
 def _set_polar_axis(ax):
@@ -648,22 +675,37 @@ def _set_polar_axis(ax):
 
 
 def _check_plot_kw(plot_kw, lines=True):
-    ls = plot_kw.pop("linestyle", None) or plot_kw.pop("ls", None)
-    if ls is None:
-        plot_kw["ls"] = "-" if lines else ""
-    else:
+    ls = plot_kw.pop("linestyle", None)
+    if ls is not None:
         plot_kw["ls"] = ls
+    if plot_kw.get("ls") is None:
+        plot_kw["ls"] = "-" if lines else ""
 
-    if plot_kw.get("marker", None) is None and not lines:
+    if not lines and plot_kw.get("marker") is None:
         plot_kw["marker"] = "o"
 
 
-def _configure_colors(ax, ws, colors):
+def _classify_colors(ws, colors):
+    # determines once how `colors` are applied to the slices given by `ws`,
+    # one of "single", "cycle" or "gradient"
     if _only_one_color(colors):
+        return "single"
+
+    if _plot_with_color_gradient(ws, colors):
+        return "gradient"
+
+    return "cycle"
+
+
+def _configure_colors(ax, ws, colors, color_mode=None):
+    if color_mode is None:
+        color_mode = _classify_colors(ws, colors)
+
+    if color_mode == "single":
         ax.set_prop_cycle("color", [colors])
         return
 
-    if _more_colors_than_plots(ws, colors) or _no_color_gradient(colors):
+    if color_mode == "cycle":
         _set_color_cycle(ax, ws, colors)
         return
 
@@ -699,17 +741,29 @@ def _set_color_cycle(ax, ws, colors):
 
 
 def _configure_color_cycle(color_cycle, colors, ws):
-    if isinstance(colors[0], tuple):
+    if _has_ws_color_pairs(colors):
+        # position of the first occurrence of each wind speed
+        ws_index = {}
+        for i, w in enumerate(ws):
+            ws_index.setdefault(w, i)
+
         for w, color in colors:
-            i = list(ws).index(w)
-            color_cycle[i] = color
+            if w not in ws_index:
+                raise ValueError(
+                    f"wind speed {w} in colors is not among the plotted wind"
+                    " speeds"
+                )
+            color_cycle[ws_index[w]] = color
 
         return
 
-    colors = itertools.islice(colors, len(color_cycle))
+    colors = list(itertools.islice(colors, len(color_cycle)))
+    color_cycle[: len(colors)] = colors
 
-    for i, color in enumerate(colors):
-        color_cycle[i] = color
+
+def _has_ws_color_pairs(colors):
+    # rgb(a) tuples are tuples as well, but color like
+    return isinstance(colors[0], tuple) and not is_color_like(colors[0])
 
 
 def _set_color_gradient(ax, ws, colors):
@@ -726,48 +780,62 @@ def _determine_color_gradient(colors, gradient):
 
 
 def _get_gradient_coefficients(gradient):
-    gradient = np.asarray(gradient)
+    gradient = np.asarray(gradient, dtype=float)
     min_gradient = gradient.min()
-    max_gradient = gradient.max()
+    span = gradient.max() - min_gradient
+
+    # a constant gradient is mapped to the first color
+    if span == 0:
+        return np.zeros_like(gradient)
 
-    return [
-        (grad - min_gradient) / (max_gradient - min_gradient)
-        for grad in gradient
-    ]
+    return (gradient - min_gradient) / span
 
 
 def _determine_colors_from_coefficients(coefficients, colors):
     min_color = np.array(to_rgb(colors[0]))
     max_color = np.array(to_rgb(colors[1]))
+    coefficients = np.asarray(coefficients, dtype=float)
+
+    # rows are the blended rgb colors
+    color_gradient = np.multiply.outer(1 - coefficients, min_color)
+    color_gradient += np.multiply.outer(coefficients, max_color)
+    return color_gradient
 
-    return [
-        (1 - coeff) * min_color + coeff * max_color for coeff in coefficients
-    ]
 
+def _configure_legend(ax, ws, colors, label, color_mode=None, **legend_kw):
+    if color_mode is None:
+        color_mode = _classify_colors(ws, colors)
 
-def _configure_legend(ax, ws, colors, label, **legend_kw):
-    if _plot_with_color_gradient(ws, colors):
+    if color_mode == "gradient":
         _set_colormap(ws, colors, ax, label, **legend_kw)
         return
 
-    if isinstance(colors[0], tuple) and not is_color_like(colors[0]):
-        _set_legend_without_wind_speeds(ax, colors, legend_kw)
+    if color_mode == "single":
+        _set_legend(ax, [(w, colors) for w in ws], legend_kw)
+        return
+
+    if _has_ws_color_pairs(colors):
+        _set_legend(ax, colors, legend_kw)
         return
 
-    _set_legend_with_wind_speeds(ax, colors, ws, legend_kw)
+    _set_legend(ax, zip(ws, colors), legend_kw)
 
 
 def _plot_with_color_gradient(ws, colors):
-    return not _no_color_gradient(colors) and len(ws) > len(colors) == 2
+    return not (
+        _more_colors_than_plots(ws, colors) or _no_color_gradient(colors)
+    )
 
 
 def _set_colormap(ws, colors, ax, label, **legend_kw):
     color_map = _create_color_map(colors)
 
+    ws = np.asarray(ws)
+
     label_kw, legend_kw = _extract_possible_text_kw(legend_kw)
     plt.colorbar(
         ScalarMappable(
-            norm=Normalize(vmin=min(ws), vmax=max(ws)), cmap=color_map
+            norm=Normalize(vmin=ws.min(), vmax=ws.max()), cmap=color_map
         ),
         ax=ax,
         **legend_kw,
@@ -778,26 +846,39 @@ def _extract_possible_text_kw(legend_kw):
     return {}, legend_kw
 
 
-def _set_legend_without_wind_speeds(ax, colors, legend_kw):
+def _set_legend(ax, ws_color_pairs, legend_kw):
     ax.legend(
         handles=[
             Line2D([0], [0], color=color, lw=1, label=f"TWS {ws}")
-            for (ws, color) in colors
+            for (ws, color) in ws_color_pairs
         ],
         **legend_kw,
     )
 
 
-def _set_legend_with_wind_speeds(ax, colors, ws, legend_kw):
-    slices = zip(ws, colors)
+def _rasterize_if_dense(plot_kw, n_points):
+    # vector output of dense scatter and surface plots is huge and slow to
+    # render, so such artists are rasterized unless specified otherwise
+    if n_points > _RASTERIZATION_THRESHOLD:
+        plot_kw.setdefault("rasterized", True)
 
-    ax.legend(
-        handles=[
-            Line2D([0], [0], color=color, lw=1, label=f"TWS {ws}")
-            for (ws, color) in slices
-        ],
-        **legend_kw,
+
+def _get_surface_triangle_mask(x, y, z, triangles):
+    txs = x[triangles]
+    tys = y[triangles]
+    tzs = z[triangles]
+
+    # squared height differences of all three pairs of vertices
+    diffz = (tzs[:, [0, 0, 1]] - tzs[:, [1, 2, 2]]) ** 2
+
+    not_too_narrow = np.any(diffz > 0.2, axis=1)
+    axis_skip = np.logical_or(
+        np.sign(txs[:, 0]) != np.sign(txs[:, 1]),
+        np.sign(txs[:, 0]) != np.sign(txs[:, 2]),
     )
+    northern = np.logical_and(*[tys[:, i] > 0 for i in range(2)])
+    no_northern_skip = np.logical_not(np.logical_and(axis_skip, northern))
+    return np.logical_and(not_too_narrow, no_northern_skip)
 
 
 def _set_3d_axis_labels(ax):
@@ -811,4 +892,29 @@ def _remove_3d_tick_labels_for_polar_coordinates(ax):
 
 
 def _create_color_map(colors):
+    try:
+        # the cached color map is shared, so callers get their own copy
+        return _create_cached_color_map(tuple(colors)).copy()
+    except TypeError:
+        # colors given as numpy arrays are not hashable
+        return LinearSegmentedColormap.from_list("cmap", list(colors))
+
+
+@lru_cache(maxsize=64)
+def _get_convex_hull_vertices(points_bytes):
+    # the same slices are usually plotted several times (for example with
+    # `plot` and `scatter`), so the hull vertices are cached, keyed by the
+    # raw bytes of the (n, 2) float array of the points
+    points = np.frombuffer(points_bytes).reshape(-1, 2)
+    try:
+        vertices = ConvexHull(points).vertices
+    except (ValueError, QhullError):
+        return None
+    vertices.flags.writeable = False
+    return vertices
+
+
+@lru_cache(maxsize=32)
+def _create_cached_color_map(colors):
+    # usually the same few colors are used for many plots
     return LinearSegmentedColormap.from_list("cmap", list(colors))
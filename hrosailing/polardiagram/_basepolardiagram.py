@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 
 import numpy as np
 
+_REAL_NUMBER_TYPES = (int, float, np.integer, np.floating)
+
 
 class PolarDiagram(ABC):
     """Base class for all polar diagrams.
@@ -91,7 +93,12 @@ class PolarDiagram(ABC):
         """
         ws = self._get_windspeeds(ws, n_steps)
         kwargs["full_info"] = full_info
-        slices = self.ws_to_slices(ws, **kwargs)
+        # rows of C-contiguous slices are contiguous, which is how they
+        # are read when plotting
+        slices = [
+            np.ascontiguousarray(slice_)
+            for slice_ in self.ws_to_slices(ws, **kwargs)
+        ]
         if full_info:
             info = self.get_slice_info(ws, slices, **kwargs)
             return ws, slices, info
@@ -100,17 +107,19 @@ class PolarDiagram(ABC):
     def _get_windspeeds(self, ws, n_steps):
         if ws is None:
             ws = self.default_slices
-        if isinstance(ws, (int, float)):
+        if isinstance(ws, _REAL_NUMBER_TYPES):
             return [ws]
-        try:
-            all_numbers = all(
-                isinstance(ws_, (int, float, np.integer, np.floating))
-                for ws_ in ws
-            )
-        except TypeError as exp:
-            raise TypeError(
-                "`ws` has to be an int a float or an iterable"
-            ) from exp
+        if _is_real_vector(ws):
+            all_numbers = True
+        else:
+            try:
+                all_numbers = all(
+                    isinstance(ws_, _REAL_NUMBER_TYPES) for ws_ in ws
+                )
+            except TypeError as exp:
+                raise TypeError(
+                    "`ws` has to be an int a float or an iterable"
+                ) from exp
         if not all_numbers:
             raise TypeError(
                 "If `ws` is an iterable, it needs to iterate over int or float"
@@ -119,20 +128,19 @@ class PolarDiagram(ABC):
             return np.array(ws)
         if n_steps <= 0:
             raise ValueError("`n_steps` has to be positive")
-        return np.concatenate(
-            [
-                np.linspace(ws_before, ws_next, n_steps + 2)[:-1]
-                for ws_before, ws_next in zip(ws, ws[1:])
-            ]
-            + [[ws[-1]]]
-        )
+        # the same values as `np.linspace(ws[i], ws[i+1], n_steps + 2)[:-1]`
+        # for all consecutive pairs, computed for all pairs at once
+        ws = np.asarray(ws, dtype=float)
+        steps = np.diff(ws) / (n_steps + 1)
+        between = ws[:-1, None] + np.arange(n_steps + 1) * steps[:, None]
+        return np.concatenate([between.ravel(), ws[-1:]])
 
     def _get_wind(self, wind):
         if isinstance(wind, np.ndarray):
             if wind.shape[1] == 2:
                 return wind
             if wind.shape[0] == 2:
-                return wind.T
+                return np.ascontiguousarray(wind.T)
             raise ValueError(
                 "`wind` should be a tuple or an array with a dimension of"
                 f" shape 2,\ngot an array of shape {wind.shape} instead."
@@ -145,7 +153,7 @@ class PolarDiagram(ABC):
                 )
             ws, wa = wind
             ws, wa = np.meshgrid(ws, wa)
-            return np.array(list(zip(ws.ravel(), wa.ravel())))
+            return np.column_stack((ws.ravel(), wa.ravel()))
         raise TypeError(
             f"`wind` should be a tuple or an array, got {type(wind)} instead."
         )
@@ -180,7 +188,8 @@ class PolarDiagram(ABC):
         slices : list of (3, *) numpy.ndarrays
             List of the requested slices. The three rows of a slice
             should correspond to the actual
-            wind speeds, the wind angles and the boat speeds
+            wind speeds, the wind angles and the boat speeds.
+            Slices are made C-contiguous by `get_slices`, if they are not.
 
         See also
         -----------
@@ -214,9 +223,15 @@ class PolarDiagram(ABC):
         if wind is None:
             return self.default_points
         wind = self._get_wind(wind)
-        bsps = [self(wa, ws) for wa, ws in wind]
+        bsps = self._get_boat_speeds(wind[:, 0], wind[:, 1])
         return np.column_stack([wind, bsps])
 
+    def _get_boat_speeds(self, ws, wa):
+        # evaluates the polar diagram for each pair of wind speed and wind
+        # angle, inheriting classes that can evaluate whole arrays at once
+        # should overwrite this
+        return np.array([self(ws_, wa_) for ws_, wa_ in zip(ws, wa)])
+
     def get_slice_info(self, ws, slices, **kwargs):
         """
         Should produce additional information about slices depending on the
@@ -251,3 +266,10 @@ class PolarDiagram(ABC):
         kwargs["ws"] = ws
         kwargs["slices"] = slices
         return None
+
+
+def _is_real_vector(ws):
+    # one dimensional arrays of integers or floats need no check per entry
+    return (
+        isinstance(ws, np.ndarray) and ws.ndim == 1 and ws.dtype.kind in "iuf"
+    )
@@ -66,15 +66,20 @@ class PolarDiagramCurve(PolarDiagram):
         self._f = f
         self._params = params
         self._rad = radians
+        self._default_points = None
 
     @property
     def default_points(self):
-        ws = np.linspace(5, 20, 128)
-        wa = np.linspace(5, 355, 144)
-        ws, wa = np.meshgrid(ws, wa)
-        ws, wa = ws.ravel(), wa.ravel()
-        bsp = np.array([self(ws_, wa_) for ws_, wa_ in zip(ws, wa)])
-        return np.column_stack([ws, wa, bsp])
+        # the curve and its parameters can not be changed, so the points
+        # are evaluated only once
+        if self._default_points is None:
+            ws = np.linspace(5, 20, 128)
+            wa = np.linspace(5, 355, 144)
+            ws, wa = np.meshgrid(ws, wa)
+            ws, wa = ws.ravel(), wa.ravel()
+            bsp = self._get_boat_speeds(ws, wa)
+            self._default_points = np.column_stack([ws, wa, bsp])
+        return self._default_points.copy()
 
     def get_slices(
         self,
@@ -113,6 +118,11 @@ class PolarDiagramCurve(PolarDiagram):
             for ws_ in ws
         ]
 
+    def _get_boat_speeds(self, ws, wa):
+        # the curve takes arrays, but may return a scalar if it does not
+        # depend on the wind
+        return np.broadcast_to(self(ws, wa), np.shape(ws))
+
     @staticmethod
     def _check_enough_params(func, params):
         try:
@@ -356,7 +356,7 @@ class PolarDiagramTable(PolarDiagram):
         `Polardiagram.default_slices`
         """
         x, y = np.meshgrid(self.wind_speeds, self.wind_angles)
-        wind = np.array(list(zip(x.ravel(), y.ravel())))
+        wind = np.column_stack((x.ravel(), y.ravel()))
         bsps = self.boat_speeds.ravel()
         return np.column_stack([wind, bsps])
 
@@ -789,19 +789,17 @@ def _incompatible_shapes(bsps, ws_resolution, wa_resolution):
 
 
 def _sort_table(ws_resolution, wa_resolution, bsps):
-    wa_resolution, bsps = zip(
-        *sorted(zip(wa_resolution, bsps), key=lambda x: x[0])
-    )
-    bsps = np.array(bsps, float)
+    ws_resolution = np.asarray(ws_resolution, float)
+    wa_resolution = np.asarray(wa_resolution, float)
 
-    ws_resolution, bsps = zip(
-        *sorted(zip(ws_resolution, bsps.T), key=lambda x: x[0])
-    )
+    # stable sorts keep the order of equal resolution values
+    ws_order = np.argsort(ws_resolution, kind="stable")
+    wa_order = np.argsort(wa_resolution, kind="stable")
 
     return (
-        np.array(ws_resolution, float),
-        np.array(wa_resolution, float),
-        np.array(bsps, float).T,
+        ws_resolution[ws_order],
+        wa_resolution[wa_order],
+        np.asarray(bsps, float)[np.ix_(wa_order, ws_order)],
     )
 
 
@@ -5,9 +5,15 @@ to create custom imputators.
 
 from abc import ABC, abstractmethod
 from datetime import timedelta
+from functools import partial
+from typing import NamedTuple
+
+import numpy as np
 
 from hrosailing.core.statistics import ComponentWithStatistics
 
+_MICROSECOND = timedelta(microseconds=1)
+
 
 class Imputator(ComponentWithStatistics, ABC):
     """Base class for all imputator classes."""
@@ -66,6 +72,21 @@ class RemoveOnlyImputator(Imputator):
         return data
 
 
+def _fill_before_default(name, right, mu):
+    # pylint: disable=unused-argument
+    return right
+
+
+def _fill_between_default(name, left, right, mu):
+    # pylint: disable=unused-argument
+    return left
+
+
+def _fill_after_default(name, left, mu):
+    # pylint: disable=unused-argument
+    return left
+
+
 class FillLocalImputator(Imputator):
     """
     An `Imputator` which assumes that the data has been stored chronologically
@@ -100,7 +121,8 @@ class FillLocalImputator(Imputator):
         First argument is the attribute `name`, second and third are the values
         of the not-`None` fields mentioned before in chronological order,
         last argument is the relative position (in time) between
-        the two mentioned not-`None` data points.
+        the two mentioned not-`None` data points. If both data points share
+        the same time, the relative position is `0`.
         Returns the value to be filled.
 
         Defaults to `lambda name, left, right, mu: left`.
@@ -129,16 +151,21 @@ class FillLocalImputator(Imputator):
 
     def __init__(
         self,
-        fill_before=lambda name, right, mu: right,
-        fill_between=lambda name, left, right, mu: left,
-        fill_after=lambda name, left, mu: left,
+        fill_before=_fill_before_default,
+        fill_between=_fill_between_default,
+        fill_after=_fill_after_default,
         max_time_diff=timedelta(minutes=2),
     ):
         super().__init__()
         self._fill_before = fill_before
         self._fill_between = fill_between
         self._fill_after = fill_after
-        self._max_time_diff = max_time_diff
+        # the default fill functions do not depend on `mu`
+        self._fill_before_is_default = fill_before is _fill_before_default
+        self._fill_between_is_default = fill_between is _fill_between_default
+        self._fill_after_is_default = fill_after is _fill_after_default
+        # times are compared as integer microseconds
+        self._max_time_diff = max_time_diff // _MICROSECOND
         self._n_filled = 0
 
     def impute(self, data):
@@ -169,14 +196,13 @@ class FillLocalImputator(Imputator):
 
         data, n_removed_rows = self._remove_rows(data)
 
-        data = self._interpolate_other(data)
+        data, none_masks = self._interpolate_other(data)
 
         # remove rows which still have None values
-        remove_rows = [
-            i
-            for i, _ in enumerate(data["datetime"])
-            if any(data[key][i] is None for key in data.keys())
-        ]
+        none_rows = np.zeros(data.n_rows, dtype=bool)
+        for none_mask in none_masks.values():
+            none_rows |= none_mask
+        remove_rows = np.flatnonzero(none_rows).tolist()
 
         data.delete(remove_rows)
         n_removed_rows += len(remove_rows)
@@ -188,20 +214,34 @@ class FillLocalImputator(Imputator):
         return data
 
     def _interpolate_datetime(self, data):
-        last_dt, last_i = None, None
-        for i, dt in enumerate(data["datetime"]):
-            if dt is None:
-                continue
-            if last_dt is None:
-                pass
-            elif abs(dt - last_dt) > self._max_time_diff:
-                continue
-            else:
-                # linear approximation of time in between
-                for j in range(last_i + 1, i):
-                    mu = (j - last_i) / (i - last_i)
-                    data["datetime"][j] = last_dt + mu * (dt - last_dt)
-            last_dt, last_i = dt, i
+        datetime = data["datetime"]
+        _, offsets = _to_timedeltas(datetime)
+        known = np.flatnonzero(~np.isnat(offsets))
+        if len(known) < 2:
+            return data
+
+        known_us = offsets.view("i8")[known]
+        missing = np.flatnonzero(np.isnat(offsets))
+
+        # position (in `known`) of the last not-None entry before each gap
+        left = np.searchsorted(known, missing) - 1
+        inner = (left >= 0) & (left < len(known) - 1)
+        missing, left = missing[inner], left[inner]
+
+        gaps = np.abs(np.diff(known_us))
+        close = gaps[left] <= self._max_time_diff
+        missing, left = missing[close], left[close]
+
+        # linear approximation of time in between, relative to the left
+        # neighbour of each gap so that the result is exact to the microsecond
+        starts, ends = known[left], known[left + 1]
+        mus = (missing - starts) / (ends - starts)
+        for i, start, end, mu in zip(
+            missing.tolist(), starts.tolist(), ends.tolist(), mus.tolist()
+        ):
+            datetime[i] = datetime[start] + mu * (
+                datetime[end] - datetime[start]
+            )
 
         return data
 
@@ -216,86 +256,164 @@ class FillLocalImputator(Imputator):
         return data, n_removed_rows
 
     def _interpolate_other(self, data):
-        # indices of not None values
-        idx_dict = {
-            key: [i for i, data in enumerate(data[key]) if data is not None]
-            for key in data.keys()
-        }
-
-        datetime = data["datetime"]
-
-        for key, idx in idx_dict.items():
-            # fill every entry before the first not-None entry according to the
-            # "fill before" function
+        # microseconds since the first datetime
+        _, offsets = _to_timedeltas(data["datetime"])
+        times = offsets.view("i8")
+        # keeps track of the entries which are still `None`, the datetime
+        # column has no `None` entries left at this point
+        none_masks = {}
+
+        for key in data.keys():
             if key == "datetime":
                 continue
+            none_masks[key] = self._impute_column(key, data, times)
 
-            self._apply_fill_functions(datetime, idx, key, data)
-            # try:
-            #    start_idx = self._aplly_fill_before(datetime, idx, key, data)
-            # except ValueError:
-            #    continue
-
-            # self._apply_fill_between(key, idx, data, datetime)
+        return data, none_masks
 
-            # self._apply_fill_after(key, idx, data, datetime, start_idx)
+    def _impute_column(self, key, data, times):
+        # fills the column `key` independently of all other columns and
+        # returns the mask of entries which are still `None`
+        column = _Column(key, data[key], _none_mask(data[key]), times)
 
-        return data
-
-    def _get_start_and_end_idx(self, datetime, i, idx):
-        try:
-            start_idx = max(
-                j
-                for j in idx
-                if j < i and datetime[i] - datetime[j] < self._max_time_diff
-            )
-        except ValueError:
-            start_idx = None
-        try:
-            end_idx = min(
-                j
-                for j in idx
-                if j > i and datetime[j] - datetime[i] < self._max_time_diff
-            )
-        except ValueError:
-            end_idx = None
-
-        return start_idx, end_idx
+        # indices of not None values
+        idx = np.flatnonzero(~column.none_mask).tolist()
+        if len(idx) == 0:
+            return column.none_mask
+
+        # fill every entry before the first not-None entry according to
+        # the "fill before" function, every entry between two not-None
+        # entries and every entry after the last not-None entry,
+        # `None` stands for the beginning resp. the end of the data
+        for bounds in zip([None] + idx, idx + [None]):
+            self._fill_range(column, bounds)
+
+        return column.none_mask
+
+    def _fill_range(self, column, bounds):
+        # fills the entries strictly between the indices `bounds` and
+        # updates the none mask of `column` accordingly
+        start_idx, end_idx = bounds
+        times = column.times
+        first = 0 if start_idx is None else start_idx + 1
+        last = len(times) if end_idx is None else end_idx
+        if first >= last:
+            # adjacent entries, nothing to fill
+            return
+
+        max_time_diff = self._max_time_diff
+
+        near_start_stop, near_end_start = _window_bounds(
+            times, (first, last), bounds, max_time_diff
+        )
 
-    def _apply_fill_functions(self, datetime, idx, key, data):
-        for i, entry in enumerate(data[key]):
-            if i in idx:
-                continue
+        duration = None
+        if start_idx is not None and end_idx is not None:
+            duration = times[end_idx] - times[start_idx]
+
+        if duration is not None and duration > max_time_diff:
+            after_stop = near_start_stop
+            between = (near_end_start, near_end_start)
+        else:
+            after_stop = min(near_start_stop, near_end_start)
+            between = (near_end_start, near_start_stop)
+        before_start = max(near_start_stop, near_end_start)
+
+        left = None if start_idx is None else column.values[start_idx]
+        right = None if end_idx is None else column.values[end_idx]
+
+        self._fill_zone(
+            column,
+            (first, after_stop),
+            partial(self._fill_after, column.key, left),
+            (start_idx, max_time_diff),
+            self._fill_after_is_default,
+        )
+        self._fill_zone(
+            column,
+            between,
+            partial(self._fill_between, column.key, left, right),
+            (start_idx, duration),
+            self._fill_between_is_default,
+        )
+        self._fill_zone(
+            column,
+            (before_start, last),
+            partial(self._fill_before, column.key, right),
+            (end_idx, max_time_diff),
+            self._fill_before_is_default,
+        )
 
-            start_idx, end_idx = self._get_start_and_end_idx(datetime, i, idx)
+    def _fill_zone(self, column, zone, fill, position, is_default):
+        # fills the entries in `range(*zone)` with `fill(mu)`, where `mu` is
+        # the absolute time difference of the entry to the entry at index
+        # `position[0]` divided by `position[1]`
+        start, stop = zone
+        if start >= stop:
+            return
+
+        self._n_filled += stop - start
+
+        if is_default:
+            # the default fill functions just repeat a neighbouring value,
+            # so the zone can be filled by a single slice assignment
+            value = fill(0)
+            column.values[start:stop] = [value] * (stop - start)
+            column.none_mask[start:stop] = value is None
+            return
+
+        reference, scale = position
+        # all entries share the same time if the scale is zero, in which case
+        # `mu` is 0 as stated in the docstring
+        mus = np.zeros(stop - start)
+        if scale != 0:
+            mus = np.abs(column.times[start:stop] - column.times[reference])
+            mus = mus / scale
+        for i, mu in enumerate(mus.tolist(), start):
+            column.values[i] = fill(mu)
+            column.none_mask[i] = column.values[i] is None
+
+
+class _Column(NamedTuple):
+    # a column of the imputed data together with the mask of its `None`
+    # entries and the microseconds since the first datetime of each entry
+    key: str
+    values: list
+    none_mask: np.ndarray
+    times: np.ndarray
+
+
+def _window_bounds(times, zone, bounds, max_time_diff):
+    # exactly the entries in `range(first, near_start_stop)` are close in time
+    # to the entry at `start_idx` and exactly the entries in
+    # `range(near_end_start, last)` are close in time to the entry at
+    # `end_idx`, since `times` is sorted
+    first, last = zone
+    start_idx, end_idx = bounds
+    window = times[first:last]
+    near_start_stop = first
+    if start_idx is not None:
+        near_start_stop += np.searchsorted(
+            window, times[start_idx] + max_time_diff, side="left"
+        )
+    near_end_start = last
+    if end_idx is not None:
+        near_end_start = first + np.searchsorted(
+            window, times[end_idx] - max_time_diff, side="right"
+        )
+    return int(near_start_stop), int(near_end_start)
 
-            if start_idx is None and end_idx is None:
-                continue
 
-            try:
-                range_too_big = (
-                    datetime[end_idx] - datetime[start_idx]
-                    > self._max_time_diff
-                )
-            except TypeError:
-                range_too_big = False
-
-            if start_idx is None:
-                mu = (datetime[end_idx] - datetime[i]) / self._max_time_diff
-                data[key][i] = self._fill_before(key, data[key][end_idx], mu)
-                self._n_filled += 1
-                continue
+def _to_timedeltas(datetimes):
+    # offsets to the first not-`None` datetime, `None` becomes `NaT`
+    reference = next(dt for dt in datetimes if dt is not None)
+    offsets = np.array(
+        [None if dt is None else dt - reference for dt in datetimes],
+        dtype="timedelta64[us]",
+    )
+    return reference, offsets
 
-            if end_idx is None or range_too_big:
-                mu = (datetime[i] - datetime[start_idx]) / self._max_time_diff
-                data[key][i] = self._fill_after(key, data[key][start_idx], mu)
-                self._n_filled += 1
-                continue
 
-            mu = (datetime[i] - datetime[start_idx]) / (
-                datetime[end_idx] - datetime[start_idx]
-            )
-            data[key][i] = self._fill_between(
-                key, data[key][start_idx], data[key][end_idx], mu
-            )
-            self._n_filled += 1
+def _none_mask(column):
+    return np.fromiter(
+        (entry is None for entry in column), dtype=bool, count=len(column)
+    )
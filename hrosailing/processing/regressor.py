@@ -167,8 +167,7 @@ class LeastSquareRegressor(Regressor):
         self._func = model_func
 
         def fitting_func(wind, *params):
-            wind = np.asarray(wind)
-            ws, wa = wind[:, 0], wind[:, 1]
+            ws, wa = wind
             return model_func(ws, wa, *params)
 
         sig = inspect.signature(model_func)
@@ -236,8 +235,12 @@ class LeastSquareRegressor(Regressor):
         #     self._log_outcome_of_regression(X, y)
 
     def _get_optimal_parameters(self, X, y):
+        # pass wind speeds and wind angles as contiguous rows, such that
+        # the fitting function, which is called in every iteration of
+        # `curve_fit`, only has to unpack them
+        wind = np.ascontiguousarray(np.asarray(X).T)
         optimal_parameters, _ = curve_fit(
-            self._fitting_func, X, y, p0=self._init_vals
+            self._fitting_func, wind, y, p0=self._init_vals
         )
         return optimal_parameters
 
@@ -246,7 +249,7 @@ def _determine_params(func):
     params = []
     while True:
         try:
-            func(np.array([[0, 0]]), *params)
+            func(np.array([[0], [0]]), *params)
             break
         except (IndexError, TypeError):
             params.append(1)
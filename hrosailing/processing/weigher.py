@@ -9,6 +9,7 @@ represent data points together with their respective weights.
 
 
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
 from datetime import timedelta
 
 import numpy as np
@@ -491,6 +492,7 @@ class FluctuationWeigher(Weigher):
         points : Data
             Has to contain the key `"datetime"` and all keys contained in the `dimension` parameter during
             initialization. Fields which do not contain `float` values are ignored.
+            The data is assumed to be stored chronologically.
 
         See also
         --------
@@ -507,16 +509,8 @@ class FluctuationWeigher(Weigher):
         weights = [1] * len(points)
 
         for curr_idx, (dt, pt) in enumerate(zip(times, points)):
-            start_idx = min(
-                i
-                for i in range(len(points))
-                if times[i] <= dt and dt - times[i] <= self._timespan_before
-            )
-            end_idx = max(
-                i
-                for i in range(len(points))
-                if dt <= times[i] and times[i] - dt <= self._timespan_after
-            )
+            start_idx = bisect_left(times, dt - self._timespan_before)
+            end_idx = bisect_right(times, dt + self._timespan_after) - 1
             for col, ub in enumerate(upper_bounds):
                 curr_pts = points[start_idx : end_idx + 1, col]
                 std = np.std(curr_pts)
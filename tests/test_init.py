@@ -0,0 +1,19 @@
+# pylint: disable-all
+
+import subprocess
+import sys
+import unittest
+
+
+class TestInit(unittest.TestCase):
+    def test_projections_registered_without_plotting_import(self):
+        # Execution Test in a fresh interpreter, such that no other test
+        # has imported `hrosailing.plotting` before
+        code = (
+            "import matplotlib\n"
+            "matplotlib.use('Agg')\n"
+            "import matplotlib.pyplot as plt\n"
+            "import hrosailing.pipeline\n"
+            "plt.subplot(projection='hro polar')\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -17,6 +17,12 @@ class TestCheckPlotKW(unittest.TestCase):
         _check_plot_kw(keywords)
         self.assertEqual(keywords, {"ls": ".."})
 
+    def test_with_empty_linestyle(self):
+        # Input/Output Test with an empty "linestyle"
+        keywords = {"linestyle": ""}
+        _check_plot_kw(keywords)
+        self.assertEqual(keywords, {"ls": ""})
+
     def test_without_linestyle_or_marker(self):
         # Input/Output Test without keywords
         keywords = {}
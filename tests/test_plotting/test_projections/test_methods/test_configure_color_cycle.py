@@ -20,3 +20,19 @@ class TestConfigureColorCycle(unittest.TestCase):
             color_cycle, ["red", "blue", "green", "orange"], [1, 2, 3]
         )
         self.assertEqual(color_cycle, ["red", "blue", "green"])
+
+    def test_rgb_tuples(self):
+        # Input/Output
+        color_cycle = ["blue"] * 3
+        _configure_color_cycle(
+            color_cycle, [(1, 0, 0), (0, 1, 0), (0, 0, 1)], [1, 2, 3]
+        )
+        self.assertEqual(color_cycle, [(1, 0, 0), (0, 1, 0), (0, 0, 1)])
+
+    def test_tuple_wind_speed_not_plotted(self):
+        # Exception Test
+        color_cycle = ["blue"] * 3
+        with self.assertRaises(ValueError):
+            _configure_color_cycle(
+                color_cycle, [(8, "green"), (1, "red")], [1, 2, 3]
+            )
@@ -36,3 +36,13 @@ class TestConfigureLegend(unittest.TestCase):
             ["label 1", "label 2", "label 3"],
             loc="upper left",
         )
+
+    def test_single_color(self):
+        # Input/Output Test
+        ax = plt.subplot()
+        _configure_legend(ax, [1, 2, 3], "red", "label")
+        handles = ax.get_legend().get_lines()
+        self.assertEqual([h.get_color() for h in handles], ["red"] * 3)
+        self.assertEqual(
+            [h.get_label() for h in handles], ["TWS 1", "TWS 2", "TWS 3"]
+        )
@@ -1,6 +1,8 @@
 # pylint: disable-all
 import unittest
 
+import numpy as np
+
 from hrosailing.plotting.projections import _create_color_map
 
 
@@ -8,3 +10,17 @@ class TestCreateColorMap(unittest.TestCase):
     def test_regular_input(self):
         # Execution Test
         _create_color_map(["red", "green", "blue"])
+
+    def test_unhashable_colors(self):
+        # Execution Test
+        _create_color_map([np.array([1, 0, 0]), np.array([0, 1, 0])])
+
+    def test_altering_result_does_not_alter_later_results(self):
+        # Test if changes to a returned color map do not leak into the cache
+        color_map = _create_color_map(["red", "green"])
+        color_map.set_bad("blue")
+        color_map.set_under("blue")
+        result = _create_color_map(["red", "green"])
+        self.assertIsNot(result, color_map)
+        np.testing.assert_array_equal(result.get_bad(), [0, 0, 0, 0])
+        np.testing.assert_array_equal(result.get_under(), result(0))
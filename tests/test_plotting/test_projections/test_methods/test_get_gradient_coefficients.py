@@ -1,6 +1,8 @@
 # pylint: disable-all
 import unittest
 
+import numpy as np
+
 from hrosailing.plotting.projections import _get_gradient_coefficients
 
 
@@ -8,4 +10,9 @@ class TestGetGradientCoefficients(unittest.TestCase):
     def test_regular_input(self):
         # Input/Output Test
         result = _get_gradient_coefficients([4, 1, 6, 9, 2])
-        self.assertEqual(result, [0.375, 0, 0.625, 1, 0.125])
+        np.testing.assert_array_equal(result, [0.375, 0, 0.625, 1, 0.125])
+
+    def test_constant_gradient(self):
+        # Input/Output Test
+        result = _get_gradient_coefficients([3, 3, 3])
+        np.testing.assert_array_equal(result, [0, 0, 0])
@@ -0,0 +1,24 @@
+# pylint: disable-all
+import unittest
+
+import numpy as np
+
+from hrosailing.plotting.projections import _get_surface_triangle_mask
+
+
+class TestGetSurfaceTriangleMask(unittest.TestCase):
+    def setUp(self) -> None:
+        self.x = np.array([1, 2, 3, 1, 2, 3, 1, 2, 3, -1, 1, 2])
+        self.y = np.array([-1, -2, -1, -1, -2, -1, -1, -2, -1, 1, 1, 2])
+        self.z = np.array([0, 0, 0, 0.4, 0, 0.8, 0, 1, 0, 0, 1, 2])
+        self.triangles = np.arange(12).reshape(4, 3)
+
+    def test_regular_input(self):
+        # Input/Output Test
+        # flat triangles, triangles crossing the northern axis are skipped,
+        # triangles which are only steep between their second and third
+        # vertex are kept
+        result = _get_surface_triangle_mask(
+            self.x, self.y, self.z, self.triangles
+        )
+        np.testing.assert_array_equal(result, [False, True, True, False])
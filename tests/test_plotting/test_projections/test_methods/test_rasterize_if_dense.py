@@ -0,0 +1,24 @@
+# pylint: disable-all
+import unittest
+
+from hrosailing.plotting.projections import _rasterize_if_dense
+
+
+class TestRasterizeIfDense(unittest.TestCase):
+    def test_few_points(self):
+        # Input/Output Test
+        keywords = {}
+        _rasterize_if_dense(keywords, 10)
+        self.assertEqual(keywords, {})
+
+    def test_many_points(self):
+        # Input/Output Test
+        keywords = {}
+        _rasterize_if_dense(keywords, 10000)
+        self.assertEqual(keywords, {"rasterized": True})
+
+    def test_explicitly_not_rasterized(self):
+        # Input/Output Test
+        keywords = {"rasterized": False}
+        _rasterize_if_dense(keywords, 10000)
+        self.assertEqual(keywords, {"rasterized": False})
@@ -0,0 +1,26 @@
+# pylint: disable-all
+import unittest
+
+import matplotlib.pyplot as plt
+
+from hrosailing.plotting.projections import _set_legend
+
+
+class TestSetLegend(unittest.TestCase):
+    def test_regular_input(self):
+        # Input/Output Test
+        ax = plt.subplot()
+        _set_legend(
+            ax,
+            [(1, "red"), (2, "green"), (3, "blue")],
+            {"loc": "upper left"},
+        )
+        labels = [text.get_text() for text in ax.get_legend().get_texts()]
+        self.assertEqual(labels, ["TWS 1", "TWS 2", "TWS 3"])
+
+    def test_zipped_input(self):
+        # Input/Output Test
+        ax = plt.subplot()
+        _set_legend(ax, zip([1, 2], ["red", "green"]), {"loc": "best"})
+        labels = [text.get_text() for text in ax.get_legend().get_texts()]
+        self.assertEqual(labels, ["TWS 1", "TWS 2"])
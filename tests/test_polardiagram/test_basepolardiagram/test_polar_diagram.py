@@ -39,6 +39,11 @@ class TestPolarDiagram(unittest.TestCase):
         result = self.pd._get_windspeeds(3.5, None)
         np.testing.assert_array_equal(result, [3.5])
 
+    def test_get_windspeeds_ws_numpy_scalar(self):
+        # Input/Output
+        result = self.pd._get_windspeeds(np.int64(3), None)
+        np.testing.assert_array_equal(result, [3])
+
     def test_get_windspeeds_ws_not_number_or_iterable(self):
         # Exception test
         with self.assertRaises(TypeError):
@@ -59,6 +59,13 @@ class TestPolarDiagramCurve(hroTestCase):
             ws, wa, bsp = point
             self.assertEqual(ws + wa + 5, bsp)
 
+    def test_default_points_not_changed_by_caller(self):
+        # Test if altering the returned points does not alter the cache
+        result = self.pd.default_points
+        expected = result.copy()
+        result[:] = 0
+        np.testing.assert_array_equal(self.pd.default_points, expected)
+
     def test_get_slices(self):
         # Execution Test
         self.pd.get_slices([1, 2, 3], 2, full_info=True, wa_resolution=2)
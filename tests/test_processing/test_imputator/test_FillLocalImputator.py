@@ -148,3 +148,96 @@ class TestFillLocalImputator(TestCase):
         """
         with self.assertRaises(KeyError):
             imp.FillLocalImputator().impute(dt.Data())
+
+    def test_impute_datetime_after_time_gap(self):
+        """
+        Input/Output-Test: datetimes after a large time gap are interpolated.
+        """
+        data = dt.Data().from_dict(
+            {
+                "datetime": [
+                    datetime(2023, 3, 13, 8),
+                    datetime(2023, 3, 13, 9),
+                    None,
+                    datetime(2023, 3, 13, 9, 1),
+                ],
+                "TWS": [14.6, 16.9, 17.2, 17.6],
+            }
+        )
+        result = imp.FillLocalImputator().impute(data)._data
+        expected_result = {
+            "datetime": [
+                datetime(2023, 3, 13, 8),
+                datetime(2023, 3, 13, 9),
+                datetime(2023, 3, 13, 9, 0, 30),
+                datetime(2023, 3, 13, 9, 1),
+            ],
+            "TWS": [14.6, 16.9, 17.2, 17.6],
+        }
+        self.assertDictEqual(result, expected_result)
+
+    def test_impute_datetime_sub_second(self):
+        """
+        Input/Output-Test: interpolated datetimes are exact to the
+        microsecond.
+        """
+        data = dt.Data().from_dict(
+            {
+                "datetime": [
+                    datetime(2023, 3, 13, 8, 0, 0, 250000),
+                    datetime(2023, 3, 13, 8, 0, 10, 500001),
+                    None,
+                    None,
+                    None,
+                    datetime(2023, 3, 13, 8, 0, 11, 500003),
+                ],
+                "TWS": [14.6, 16.9, 17.2, 17.4, 17.5, 17.6],
+            }
+        )
+        result = imp.FillLocalImputator().impute(data)._data
+        expected_result = {
+            "datetime": [
+                datetime(2023, 3, 13, 8, 0, 0, 250000),
+                datetime(2023, 3, 13, 8, 0, 10, 500001),
+                datetime(2023, 3, 13, 8, 0, 10, 750001),
+                datetime(2023, 3, 13, 8, 0, 11, 2),
+                datetime(2023, 3, 13, 8, 0, 11, 250003),
+                datetime(2023, 3, 13, 8, 0, 11, 500003),
+            ],
+            "TWS": [14.6, 16.9, 17.2, 17.4, 17.5, 17.6],
+        }
+        self.assertDictEqual(result, expected_result)
+
+    def test_impute_custom_fill_between_same_time(self):
+        """
+        EdgeCase: not-`None` values sharing the same time are filled
+        in between with `mu = 0`.
+        """
+        mus = []
+
+        def fill_between(name, left, right, mu):
+            mus.append(mu)
+            return left + mu * (right - left)
+
+        data = dt.Data().from_dict(
+            {
+                "datetime": [
+                    datetime(2023, 3, 13, 8),
+                    datetime(2023, 3, 13, 8),
+                    datetime(2023, 3, 13, 8),
+                    datetime(2023, 3, 13, 8),
+                ],
+                "TWS": [14.6, None, None, 17.6],
+            }
+        )
+        result = (
+            imp.FillLocalImputator(fill_between=fill_between)
+            .impute(data)
+            ._data
+        )
+        expected_result = {
+            "datetime": [datetime(2023, 3, 13, 8)] * 4,
+            "TWS": [14.6, 14.6, 14.6, 17.6],
+        }
+        self.assertDictEqual(result, expected_result)
+        self.assertListEqual(mus, [0, 0])